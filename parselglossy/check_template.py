@@ -118,12 +118,12 @@ def _rec_is_template_valid(template: JSONDict, *, address: Tuple = ()) -> List[E
 
     errors = []
 
-    keywords = template["keywords"] if "keywords" in template.keys() else []
+    keywords = template.get("keywords", [])
     for k in keywords:
         errs = _check_keyword(k, address=address)
         errors.extend(errs)
 
-    sections = template["sections"] if "sections" in template.keys() else []
+    sections = template.get("sections", [])
     for s in sections:
         if _undocumented(s):
             errors.append(
@@ -230,21 +230,22 @@ def _rec_reoder_template(template: JSONDict) -> None:
     ----------
     template : JSONDict
     """
-    keywords = template["keywords"] if "keywords" in template.keys() else []
+    keywords = template.get("keywords", [])
     kw_stencil = view_by_default_keywords(keywords)
     deps = _sections_default_dependencies(kw_stencil)
     deps_hashable = [(tuple(_from), tuple(_to)) for (_from, _to) in deps]
     nodes = reversed([x[-1] for x in nx.DiGraph(deps_hashable)])
 
+    by_name = {x["name"]: x for x in keywords}
     shuffle = []
     for node in nodes:
-        for x in keywords:
-            if x["name"] == node:
-                shuffle.append(deepcopy(x))
-                keywords.remove(x)
-    keywords.extend(shuffle)
+        x = by_name.pop(node, None)
+        if x is not None:
+            shuffle.append(x)
+    if shuffle:
+        keywords[:] = [x for x in keywords if x["name"] in by_name] + shuffle
 
-    sections = template["sections"] if "sections" in template.keys() else []
+    sections = template.get("sections", [])
     for s in sections:
         _rec_reoder_template(s)
 
@@ -278,7 +279,7 @@ def _check_keyword(keyword: JSONDict, *, address: Tuple = ()) -> List[Error]:
     errors = []
 
     k = keyword["name"]
-    if "sections" in keyword.keys():
+    if "sections" in keyword:
         errors.append(
             Error((address + (k,)), "Sections cannot be nested under keywords.")
         )
@@ -295,10 +296,8 @@ def _check_keyword(keyword: JSONDict, *, address: Tuple = ()) -> List[Error]:
 
 
 def _undocumented(x: JSONDict) -> bool:
-    return (
-        True if "docstring" not in x.keys() or x["docstring"].strip() == "" else False
-    )
+    return True if "docstring" not in x or x["docstring"].strip() == "" else False
 
 
 def _untyped(x: JSONDict) -> bool:
-    return True if "type" not in x.keys() or x["type"] not in allowed_types else False
+    return True if "type" not in x or x["type"] not in allowed_types else False
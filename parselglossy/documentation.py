@@ -73,27 +73,38 @@ def documentation_generator(
     return documentation
 
 
-def _document_keyword(keyword: JSONDict) -> str:
-    docstring = keyword["docstring"].replace("\n", " ")
-    doc = f"""
- :{keyword['name']:s}: {docstring:s}
+_KEYWORD_FMT = """
+ :{name:s}: {docstring:s}
 
-  **Type** ``{keyword['type']:s}``
+  **Type** ``{type:s}``
 """
 
-    if "default" in keyword.keys():
-        doc += f"""
-  **Default** ``{keyword['default']}``
+_DEFAULT_FMT = """
+  **Default** ``{default}``
 """
 
-    if "predicates" in keyword.keys():
-        preds = "\n    ".join((f"- ``{x}``" for x in keyword["predicates"]))
-        doc += f"""
+_PREDICATES_FMT = """
   **Predicates**
-    {preds}
+    {predicates}
 """
 
-    return doc
+
+def _document_keyword(keyword: JSONDict) -> str:
+    docstring = keyword["docstring"].replace("\n", " ")
+    parts = [
+        _KEYWORD_FMT.format(
+            name=keyword["name"], docstring=docstring, type=keyword["type"]
+        )
+    ]
+
+    if "default" in keyword:
+        parts.append(_DEFAULT_FMT.format(default=keyword["default"]))
+
+    if "predicates" in keyword:
+        preds = "\n    ".join((f"- ``{x}``" for x in keyword["predicates"]))
+        parts.append(_PREDICATES_FMT.format(predicates=preds))
+
+    return "".join(parts)
 
 
 def _rec_documentation_generator(template, *, level: int = 0) -> str:
@@ -111,22 +122,19 @@ def _rec_documentation_generator(template, *, level: int = 0) -> str:
 
     docs = []  # type: List[str]
 
-    keywords = template["keywords"] if "keywords" in template.keys() else []
+    keywords = template.get("keywords", [])
     if keywords:
-        docs.append(_indent("\n:red:`Keywords`", level))
-
-    for k in keywords:
-        doc = _document_keyword(k)
-        docs.extend(_indent(doc, level))
+        parts = ["\n:red:`Keywords`"] + [_document_keyword(k) for k in keywords]
+        docs.append(_indent("".join(parts), level))
 
-    sections = template["sections"] if "sections" in template.keys() else []
+    sections = template.get("sections", [])
     if sections:
-        docs.append(_indent("\n:red:`Sections`", level))
+        parts = ["\n:red:`Sections`"]
         for s in sections:
             docstring = s["docstring"].replace("\n", " ")
-            doc = f"\n :{s['name']:s}: {docstring:s}\n"
-            doc += _rec_documentation_generator(s, level=level + 1)
-            docs.extend(_indent(doc, level))
+            parts.append(f"\n :{s['name']:s}: {docstring:s}\n")
+            parts.append(_rec_documentation_generator(s, level=level + 1))
+        docs.append(_indent("".join(parts), level))
 
     return "".join(docs)
 
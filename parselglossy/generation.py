@@ -115,11 +115,11 @@ def prune_docstrings(stencil: JSONDict) -> JSONDict:
 
 
 def _rec_prune_docstrings(stencil: JSONDict) -> None:
-    keywords = stencil["keywords"] if "keywords" in stencil.keys() else []
+    keywords = stencil.get("keywords", [])
     for k in keywords:
         k.pop("docstring")
 
-    sections = stencil["sections"] if "sections" in stencil.keys() else []
+    sections = stencil.get("sections", [])
     for s in sections:
         s.pop("docstring")
         _rec_prune_docstrings(s)
@@ -47,6 +47,16 @@ AllowedTypes = Union[ScalarTypes, ListTypes]
 
 allowed_types = allowed_scalar_types + allowed_list_types
 
+_COMPLEX_RE = re.compile(r"^.*\d+j$")
+
+_TYPE_OBJ = {
+    "bool": bool,
+    "complex": complex,
+    "float": float,
+    "int": int,
+    "str": str,
+}  # type: Dict[str, type]
+
 
 def type_matches(value: AllowedTypes, expected_type: str) -> Optional[bool]:
     """Checks whether a value is of the expected type.
@@ -84,20 +94,13 @@ def type_matches(value: AllowedTypes, expected_type: str) -> Optional[bool]:
     """
 
     # first verify whether expected_type is allowed
-    if expected_type not in allowed_types:
+    check = type_checkers.get(expected_type)
+    if check is None:
         raise ValueError(f"could not recognize expected_type: {expected_type}")
 
     expected_complex = expected_type == "complex" or expected_type == "List[complex]"
 
-    expected_type_is_list = re.search(r"^List\[(\w+)\]$", expected_type)
-
-    matches = False
-    if expected_type_is_list is not None:
-        matches = _type_check_list(
-            value, expected_type_is_list.group(1)
-        )  # type: ignore
-    else:
-        matches = _type_check_scalar(value, expected_type)  # type: ignore
+    matches = check(value)
 
     recheck_complex = (
         expected_complex
@@ -119,7 +122,7 @@ def _complex_helper(
     value: Union[complex, List[complex]]
 ) -> Optional[Union[complex, List[complex]]]:
     try:
-        if type(value).__name__ == "list":
+        if isinstance(value, list):
             return type_fixers["List[complex]"](value)
         else:
             return type_fixers["complex"](value)
@@ -128,42 +131,39 @@ def _complex_helper(
 
 
 def _scalar_type_is_str(value: AllowedTypes) -> bool:
-    return any(
-        [_type_check_scalar(value, "str"), _type_check_list(value, "str")]
-    )  # type: ignore
+    return type_checkers["str"](value) or type_checkers["List[str]"](value)
 
 
 def _str_is_complex_number(value: AllowedTypes) -> bool:
-    cmplx = re.compile(r"^.*\d+j$")
-    if type(value).__name__ == "list":
-        return all((cmplx.match(x) is not None for x in value))
+    if isinstance(value, list):
+        return all((_COMPLEX_RE.match(x) is not None for x in value))
     else:
-        return cmplx.match(value) is not None
+        return _COMPLEX_RE.match(value) is not None
 
 
-def _type_check_scalar(value: ScalarTypes, expected_type: str) -> bool:
-    return type(value).__name__ == expected_type
+def _scalar_checker(t: type) -> Callable[[Any], bool]:
+    return lambda x: type(x) is t
 
 
-def _type_check_list(value: ListTypes, expected_type: str) -> bool:
-    if type(value).__name__ == "list":
-        type_checks = all((_type_check_scalar(x, expected_type) for x in value))
-    else:
-        type_checks = False
+def _list_checker(t: type) -> Callable[[Any], bool]:
+    ts = frozenset((t,))
+    # An empty list yields an empty set, which is a subset of anything.
+    return lambda x: type(x) is list and set(map(type, x)) <= ts
+
+
+type_checkers = {
+    **{k: _scalar_checker(v) for k, v in _TYPE_OBJ.items()},
+    **{f"List[{k}]": _list_checker(v) for k, v in _TYPE_OBJ.items()},
+}  # type: Dict[str, Callable[[Any], bool]]
+"""Dict[str, Callable[[Any], bool]]: dictionary holding functions for type checking."""
 
-    return type_checks
+
+def _list_fixer(f: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    return lambda x: list(map(f, x))
 
 
 type_fixers = {
-    "bool": bool,
-    "complex": complex,
-    "float": float,
-    "int": int,
-    "str": str,
-    "List[bool]": lambda x: list(map(bool, x)),
-    "List[complex]": lambda x: list(map(complex, x)),
-    "List[float]": lambda x: list(map(float, x)),
-    "List[int]": lambda x: list(map(int, x)),
-    "List[str]": lambda x: list(map(str, x)),
+    **_TYPE_OBJ,
+    **{f"List[{k}]": _list_fixer(v) for k, v in _TYPE_OBJ.items()},
 }  # type: Dict[str, Callable[[Any], Any]]
 """Dict[str, Callable[[Any], Any]]: dictionary holding functions for type fixation."""
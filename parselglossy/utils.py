@@ -69,7 +69,7 @@ def location_in_dict(*, address: Tuple, dict_name: str = "user") -> str:
     -------
     where : str
     """
-    return reduce(lambda x, y: x + f"['{y}']", address, "user")
+    return dict_name + "".join([f"['{k}']" for k in address])
 
 
 def path_resolver(f: Union[str, Path], *, touch: bool = True) -> Path:
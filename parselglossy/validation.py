@@ -40,7 +40,7 @@ from .validation_plumbing import (
     _rec_fix_defaults,
     _rec_merge_ours,
 )
-from .views import view_by_default, view_by_predicates, view_by_type
+from .views import view_for_validation
 
 
 def validate_from_dicts(
@@ -67,9 +67,7 @@ def validate_from_dicts(
     ------
     :exc:`ParselglossyError`
     """
-    stencil = view_by_default(template)
-    types = view_by_type(template)
-    predicates = view_by_predicates(template)
+    stencil, types, predicates = view_for_validation(template)
 
     fr = merge_ours(theirs=stencil, ours=ir)
     fr = fix_defaults(fr, types=types)
@@ -29,12 +29,14 @@
 
 """Plumbing functions powering our validation facilities."""
 
+import ast
 from copy import deepcopy
-from typing import Any, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Tuple
 
 from .exceptions import Error
 from .types import type_fixers, type_matches
-from .utils import JSONDict, location_in_dict, nested_set
+from .utils import JSONDict, nested_set
 
 
 def _rec_merge_ours(
@@ -65,22 +67,24 @@ def _rec_merge_ours(
     errors = []
 
     # Check whether ours has keywords/sections that are unknown
-    difference = set(ours.keys()).difference(set(theirs.keys()))
-    if difference != set():
-        for k in difference:
-            what = "section" if isinstance(ours[k], dict) else "keyword"
-            errors.append(Error(message=f"Found unexpected {what}: '{k}'."))
+    for k in ours.keys() - theirs.keys():
+        what = "section" if isinstance(ours[k], dict) else "keyword"
+        errors.append(Error(message=f"Found unexpected {what}: '{k}'."))
 
     for k, v in theirs.items():
-        if k not in ours.keys():
-            if theirs[k] is not None:
-                outgoing[k] = theirs[k]
+        if k not in ours:
+            if v is not None:
+                outgoing[k] = v
             else:
                 outgoing[k] = None
                 msg = f"Keyword '{k}' is required but has no value."
                 errors.append(Error((address + (k,)), msg))
         elif not isinstance(v, dict):
             outgoing[k] = ours[k]
+        elif not isinstance(ours[k], dict):
+            outgoing[k] = ours[k]
+            msg = f"Expected section '{k}', found keyword instead."
+            errors.append(Error((address + (k,)), msg))
         else:
             outgoing[k], errs = _rec_merge_ours(
                 theirs=v, ours=ours[k], address=(address + (k,))
@@ -152,52 +156,67 @@ def _rec_fix_defaults(
     if start_dict is None:
         start_dict = deepcopy(incoming)
 
-    outgoing = {}
+    outgoing = {}  # type: JSONDict
     errors = []
 
-    for k, v in incoming.items():
-        if not isinstance(v, dict):
-            t = types[k]
-            types_ok = type_matches(v, t)
-            if types_ok:
-                # Yes! Types match up front, you're awesome
-                msg = ""
-                outgoing[k] = type_fixers[t](v)
+    # Local aliases save a global lookup per keyword in the loop below
+    _type_matches = type_matches
+    _type_fixers = type_fixers
+
+    for k, t in types.items():
+        if k not in incoming:
+            # Missing keywords and sections are reported when merging
+            continue
+        v = incoming[k]
+        here = address + (k,)
+        if isinstance(t, dict):
+            if isinstance(v, dict):
+                outgoing[k], errs = _rec_fix_defaults(
+                    incoming=v, types=t, start_dict=start_dict, address=here,
+                )
+                errors.extend(errs)
             else:
-                # Types did not match :/
-                if isinstance(v, str) and "user" in v:
-                    # BUT! It's actually a string and it's a callable
-                    # We assume that if it contains the reserved tokens "value"
-                    # or "user" we're trying to perform some sort of defaulting
-                    # action.
-                    msg, outgoing[k] = run_callable(v, start_dict, t=t)
-                else:
-                    # NOPE. You're an unrepentant sinner
-                    actual = (
-                        type(v).__name__
-                        if type(v) is not list
-                        else f"List[{', '.join([type(x).__name__ for x in v])}]"
-                    )
-                    msg = f"Actual ({actual}) and declared ({t}) types do not match."
-            if msg != "":
-                errors.append(Error(address + (k,), msg))
+                actual = _type_name(v)
+                msg = f"Actual ({actual}) and declared (section) types do not match."
+                errors.append(Error(here, msg))
+            continue
+
+        types_ok = _type_matches(v, t)
+        if types_ok:
+            # Yes! Types match up front, you're awesome
+            msg = ""
+            outgoing[k] = _type_fixers[t](v)
+        else:
+            # Types did not match :/
+            if isinstance(v, str) and "user" in v:
+                # BUT! It's actually a string and it's a callable
+                # We assume that if it contains the reserved tokens "value"
+                # or "user" we're trying to perform some sort of defaulting
+                # action.
+                msg, outgoing[k] = run_callable(v, start_dict, t=t)
             else:
-                # Update start_dict.
-                # This is so that multiple dependent defaults ("chains") behave
-                # correctly. See #76 on GitHub
-                nested_set(start_dict, address + (k,), outgoing[k])
+                # NOPE. You're an unrepentant sinner
+                msg = f"Actual ({_type_name(v)}) and declared ({t}) types do not match."
+        if msg != "":
+            errors.append(Error(here, msg))
         else:
-            outgoing[k], errs = _rec_fix_defaults(
-                incoming=v,
-                types=types[k],
-                start_dict=start_dict,
-                address=(address + (k,)),
-            )
-            errors.extend(errs)
+            # Update start_dict.
+            # This is so that multiple dependent defaults ("chains") behave
+            # correctly. See #76 on GitHub
+            nested_set(start_dict, here, outgoing[k])
 
     return outgoing, errors
 
 
+def _type_name(v: Any) -> str:
+    if isinstance(v, dict):
+        return "section"
+    elif type(v) is list:
+        return f"List[{', '.join([type(x).__name__ for x in v])}]"
+    else:
+        return type(v).__name__
+
+
 def _rec_check_predicates(
     incoming: JSONDict,
     *,
@@ -230,32 +249,30 @@ def _rec_check_predicates(
         start_dict = incoming
 
     for k, v in incoming.items():
-        if predicates[k] is not None:
+        ps = predicates[k]
+        if ps is not None:
+            here = address + (k,)
             if not isinstance(v, dict):
-                for p in predicates[k]:
-                    where = location_in_dict(address=(address + (k,)))
-                    msg, success = run_predicate(p, where, start_dict)
+                for p in ps:
+                    msg, success = run_predicate(p, v, start_dict)
                     if not success:
-                        errors.append(Error((address + (k,)), msg))
+                        errors.append(Error(here, msg))
             else:
                 errs = _rec_check_predicates(
-                    incoming=v,
-                    predicates=predicates[k],
-                    start_dict=start_dict,
-                    address=(address + (k,)),
+                    incoming=v, predicates=ps, start_dict=start_dict, address=here,
                 )
                 errors.extend(errs)
 
     return errors
 
 
-def run_predicate(predicate: str, where: str, user: JSONDict) -> Tuple[str, bool]:
+def run_predicate(predicate: str, value: Any, user: JSONDict) -> Tuple[str, bool]:
     """Run a predicate to check whether it is satisfied.
 
     Parameters
     ----------
     predicate : str
-    where : str
+    value : Any
     user : JSONDict
 
     Returns
@@ -263,14 +280,15 @@ def run_predicate(predicate: str, where: str, user: JSONDict) -> Tuple[str, bool
 
     Notes
     -----
-    We replace the convenience placeholder "value" with its full "address" in ``user``.
+    The convenience placeholder "value" is bound to ``value``, the keyword the
+    predicate is attached to. Since the closure does not depend on where the
+    keyword is in ``user``, it is compiled only once for all keywords sharing
+    the same predicate.
     """
 
-    p = predicate.replace("value", where)
-
     try:
         msg = ""
-        success = eval(f"lambda user: {p}")(user)
+        success = _closure(predicate, "user, value", allow_tuple=False)(user, value)
         if not success:
             msg = f"Predicate '{predicate}' not satisfied."
     except KeyError as e:
@@ -324,7 +342,7 @@ def run_callable(f: str, d: JSONDict, *, t: str) -> Tuple[str, Optional[Any]]:
 
     try:
         msg = ""
-        result = eval(f"lambda user: {f}")(d)
+        result = _closure(f)(d)
         result = type_fixers[t](result)
     except KeyError as e:
         msg = f"KeyError {e} in closure '{f}'."
@@ -340,3 +358,48 @@ def run_callable(f: str, d: JSONDict, *, t: str) -> Tuple[str, Optional[Any]]:
         result = None
 
     return msg, result
+
+
+@lru_cache(maxsize=None)
+def _closure(
+    body: str, params: str = "user", *, allow_tuple: bool = True
+) -> Callable[..., Any]:
+    """Compile a closure over the input tree, encoded as a string.
+
+    Parameters
+    ----------
+    body : str
+        The body of the closure. The input tree is called ``user``.
+    params : str
+        The parameters of the closure. Defaults to ``user``.
+    allow_tuple : bool
+        Whether the body may be a bare tuple. Defaults to ``True``.
+
+    Returns
+    -------
+    closure : Callable[..., Any]
+
+    Raises
+    ------
+    :exc:`SyntaxError`
+
+    Notes
+    -----
+    Compiled closures are cached, so that each distinct closure is parsed and
+    compiled only once, no matter how many times it is run.
+
+    The body is parsed on its own as a single expression and grafted onto the
+    syntax tree of a ``lambda`` taking ``params``. Contrary to pasting the
+    body into the source of a ``lambda``, this guarantees that the whole body,
+    and nothing else, ends up in the closure.
+    Predicates set ``allow_tuple`` to ``False``: a predicate that is a bare
+    tuple, *e.g.* ``value > 5, value < 0``, would always be truthy, while the
+    comma is most likely a typo for ``and``. Callable defaults may instead
+    evaluate to a tuple, *e.g.* ``(user['a'], user['b'])`` for a list.
+    """
+    tree = ast.parse(f"lambda {params}: None", mode="eval")
+    expr = ast.parse(body.strip(), mode="eval").body
+    if not allow_tuple and isinstance(expr, ast.Tuple):
+        raise SyntaxError("top-level tuple, use 'and'/'or' to combine conditions")
+    tree.body.body = expr  # type: ignore
+    return eval(compile(tree, "<closure>", "eval"))
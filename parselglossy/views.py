@@ -29,7 +29,7 @@
 
 """Tools to extract views of dictionaries."""
 
-from typing import Any, Callable, List, Optional, Type
+from typing import Any, Callable, List, Optional, Tuple, Type
 
 from .exceptions import ParselglossyError
 from .utils import JSONDict
@@ -125,6 +125,45 @@ def view_by_predicates(d: JSONDict) -> JSONDict:
     return view_by("predicates", d)
 
 
+def view_for_validation(d: JSONDict) -> Tuple[JSONDict, JSONDict, JSONDict]:
+    """Views by defaults, types, and predicates in a single traversal.
+
+    Parameters
+    ----------
+    d: JSONDict
+
+    Returns
+    -------
+    defaults: JSONDict
+       A dictionary with a view by defaults.
+    types: JSONDict
+       A dictionary with a view by types.
+    predicates: JSONDict
+       A dictionary with a view by predicates.
+
+    Notes
+    -----
+    The views are the same as those returned by :func:`view_by_default`,
+    :func:`view_by_type`, and :func:`view_by_predicates`, but the template is
+    walked only once.
+    """
+    defaults = {}  # type: JSONDict
+    types = {}  # type: JSONDict
+    predicates = {}  # type: JSONDict
+
+    for v in d.get("keywords", []):
+        k = v["name"]
+        defaults[k] = v.get("default")
+        types[k] = v.get("type", ParselglossyError)
+        predicates[k] = v.get("predicates")
+
+    for section in d.get("sections", []):
+        k = section["name"]
+        defaults[k], types[k], predicates[k] = view_for_validation(section)
+
+    return defaults, types, predicates
+
+
 def view_by(
     what: str,
     d: JSONDict,
@@ -170,7 +209,7 @@ def view_by(
     if has_keywords:
         view = {
             v["name"]: transformer(v[what])
-            if all([what in v, predicate(v, what)])
+            if what in v and predicate(v, what)
             else missing
             for v in d["keywords"]
         }
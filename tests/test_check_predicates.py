@@ -49,6 +49,7 @@ def user():
             "another_number": 10,
             "functional": "B3LYP",
             "max_num_iterations": 20,
+            "max_value": 30,
             "some_acceleration": False,
             "some_complex_number": complex("0.0+0.0j"),
             "thresholds": {"energy": 0.001, "some_integral_screening": 0.0001},
@@ -62,6 +63,7 @@ empty_predicates = {
         "another_number": None,
         "functional": None,
         "max_num_iterations": None,
+        "max_value": None,
         "some_acceleration": None,
         "some_complex_number": None,
         "thresholds": {"energy": None, "some_integral_screening": None},
@@ -76,6 +78,18 @@ def valid_predicates():
     return d
 
 
+def comma_predicates():
+    d = deepcopy(empty_predicates)
+    d["scf"]["another_number"] = ["value > 50, value < 0"]
+    return d
+
+
+def placeholder_in_key_predicates():
+    d = deepcopy(empty_predicates)
+    d["scf"]["another_number"] = ["value < user['scf']['max_value']"]
+    return d
+
+
 def failing_predicates():
     d = deepcopy(empty_predicates)
     d["scf"]["another_number"] = ["value % 3 == 0"]
@@ -118,6 +132,7 @@ def multiple_errors_predicates():
 
 testdata = [
     (valid_predicates(), None, [""]),
+    (placeholder_in_key_predicates(), None, [""]),
     (
         failing_predicates(),
         pytest.raises(ParselglossyError),
@@ -132,6 +147,13 @@ testdata = [
             r"Error(?:s)? occurred when checking predicates:\n- At user\['scf'\]\['another_number'\]:\s+SyntaxError.*"
         ],
     ),
+    (
+        comma_predicates(),
+        pytest.raises(ParselglossyError),
+        [
+            r"Error(?:s)? occurred when checking predicates:\n- At user\['scf'\]\['another_number'\]:\s+SyntaxError top-level tuple.*in closure 'value > 50, value < 0'\."
+        ],
+    ),
     (
         name_error_predicates(),
         pytest.raises(ParselglossyError),
@@ -169,8 +191,10 @@ testdata = [
     testdata,
     ids=[
         "valid",
+        "placeholder_in_key",
         "failing",
         "syntax_error",
+        "comma",
         "name_error",
         "key_error",
         "type_error",
@@ -188,3 +188,21 @@ def test_fix_defaults(types, user, ref, raises, error_message):
         assert outgoing == ref
         # Check error message is correct
         assert re.match("|".join(error_message), str(e)) is not None
+
+
+def test_fix_defaults_shape_mismatch(types):
+    d = deepcopy(raw)
+    d["scf"]["thresholds"] = 1.0
+    d["title"] = {"foo": "bar"}
+    msg4 = r"- At user\['scf'\]\['thresholds'\]:\s+Actual \(float\) and declared \(section\) types do not match\."
+    msg5 = r"- At user\['title'\]:\s+Actual \(section\) and declared \(str\) types do not match\."
+    with pytest.raises(ParselglossyError, match=error_preamble + msg4 + r"\n" + msg5):
+        fix_defaults(d, types=types)
+
+
+def test_fix_defaults_tuple_action(types):
+    d = deepcopy(raw)
+    d["list_of_strings"] = "(user['title'], user['scf']['functional'])"
+    ref = valid()
+    ref["list_of_strings"] = ["My fantastic calculation", "B3LYP"]
+    assert fix_defaults(d, types=types) == ref
@@ -33,7 +33,7 @@ import pytest
 from hypothesis import given
 from hypothesis import strategies as st
 
-from parselglossy.types import type_matches
+from parselglossy.types import type_fixers, type_matches
 
 
 @given(a=st.booleans())
@@ -121,7 +121,32 @@ def test_type_matches_list_complex(a):
     assert not type_matches(a, "List[float]")
 
 
+@given(
+    a=st.lists(st.integers(min_value=-(2 ** 53), max_value=2 ** 53), min_size=100)
+)
+def test_type_matches_long_list_is_exact(a):
+    assert type_matches(a, "List[int]")
+    assert not type_matches(a + [1.0], "List[int]")
+    assert not type_matches(a + [True], "List[int]")
+    assert not type_matches([float(x) for x in a] + [1], "List[float]")
+
+
+@pytest.mark.parametrize("t", ["bool", "str", "int", "float", "complex"])
+def test_type_matches_empty_list(t):
+    assert type_matches([], f"List[{t}]")
+
+
 def test_type_matches_unexpected():
     with pytest.raises(ValueError):
         assert type_matches("example", "weird")
         assert type_matches("example", "List[strange]")
+
+
+def test_type_fixers_list():
+    assert type_fixers["List[bool]"]([0, 1]) == [False, True]
+    assert type_fixers["List[complex]"](["1+2j", 3]) == [1 + 2j, 3 + 0j]
+    assert type_fixers["List[float]"](["1.5", 2]) == [1.5, 2.0]
+    assert type_fixers["List[int]"](["1", 2.0]) == [1, 2]
+    assert type_fixers["List[str]"]([1, 2.5]) == ["1", "2.5"]
+    for t in ["bool", "complex", "float", "int", "str"]:
+        assert type_matches(type_fixers[f"List[{t}]"](["1"]), f"List[{t}]")
@@ -276,3 +276,48 @@ def test_validation(
             validated = json.load(v, object_hook=as_complex)
         assert validated == valid
         dumped.unlink()
+
+
+def test_validation_honors_template_changes():
+    template = {
+        "keywords": [
+            {"name": "a", "type": "int", "default": 1, "docstring": "A number."}
+        ]
+    }
+
+    assert validate_from_dicts(ir={}, template=template) == {"a": 1}
+
+    template["keywords"][0]["default"] = 2
+    assert validate_from_dicts(ir={}, template=template) == {"a": 2}
+
+    template["keywords"].append(
+        {"name": "b", "type": "int", "default": 0, "docstring": "Another number."}
+    )
+    assert validate_from_dicts(ir={"b": 3}, template=template) == {"a": 2, "b": 3}
+
+
+def test_validation_shape_mismatch():
+    template = {
+        "keywords": [{"name": "a", "type": "int", "docstring": "A number."}],
+        "sections": [
+            {
+                "name": "s",
+                "docstring": "A section.",
+                "keywords": [
+                    {"name": "b", "type": "int", "default": 1, "docstring": "B."}
+                ],
+            }
+        ],
+    }
+
+    with pytest.raises(
+        ParselglossyError,
+        match=r"Error(?:s)? occurred when merging:\n- At user\['s'\]:\s+Expected section 's', found keyword instead\.",
+    ):
+        validate_from_dicts(ir={"a": 1, "s": 1.0}, template=template)
+
+    with pytest.raises(
+        ParselglossyError,
+        match=r"Error(?:s)? occurred when fixing defaults:\n- At user\['a'\]:\s+Actual \(section\) and declared \(int\) types do not match\.",
+    ):
+        validate_from_dicts(ir={"a": {"x": 1}, "s": {"b": 2}}, template=template)
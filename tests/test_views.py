@@ -124,3 +124,7 @@ def test_view_by(template, viewer, reference, raises):
     with raises:
         view = viewer(template)
         assert view == reference
+
+
+def test_view_for_validation(template):
+    assert views.view_for_validation(template) == (defaults, types, predicates)